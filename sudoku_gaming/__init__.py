@@ -1,11 +1,21 @@
+from sudoku_gaming.archive import (
+    PuzzleArchive,
+    pack_board,
+    save_archive,
+    unpack_board,
+)
 from sudoku_gaming.gaming import generate, solve
 from sudoku_gaming.sudoku import Sudoku
 from sudoku_gaming.types import SudokuBoard
 
 
 __all__ = [
+    "PuzzleArchive",
     "Sudoku",
     "SudokuBoard",
     "generate",
+    "pack_board",
+    "save_archive",
     "solve",
+    "unpack_board",
 ]
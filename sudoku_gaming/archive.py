@@ -0,0 +1,266 @@
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from sudoku_gaming.sudoku import Sudoku
+from sudoku_gaming.types import SudokuBoard
+from sudoku_gaming.utils import (
+    _PACKED_BOARD_SIZE,
+    _has_valid_cells,
+    _pack_board,
+    _unpack_board,
+)
+
+
+# file header: magic bytes, format version, flags and reserved padding
+_MAGIC = b"SDKU"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBH")
+
+# header flag set when each record also contains the puzzle's solution
+_FLAG_SOLUTION = 0x01
+
+
+def pack_board(board: SudokuBoard) -> bytes:
+    """
+    Pack a SudokuBoard into bytes, using 4 bits per cell.
+
+    Parameters
+    ----------
+    board: SudokuBoard
+        A 9x9 array of integers between 0 and 9 inclusive.
+
+    Returns
+    -------
+    bytes
+        The packed board (41 bytes), readable with `unpack_board`.
+    """
+    if not _has_valid_cells(board):
+        raise ValueError("Board is invalid, has incorrect structure or values.")
+
+    return _pack_board(board)
+
+
+def unpack_board(data: bytes | memoryview) -> SudokuBoard:
+    """
+    Unpack a SudokuBoard from bytes created with `pack_board`.
+
+    Parameters
+    ----------
+    data: bytes | memoryview
+        A 41 byte packed board.
+
+    Returns
+    -------
+    SudokuBoard
+    """
+    if len(data) != _PACKED_BOARD_SIZE:
+        raise ValueError(f"Packed board has an invalid length ({len(data)}).")
+
+    board = _unpack_board(data)
+    if not _has_valid_cells(board):
+        raise ValueError("Packed board has invalid cell values.")
+
+    return board
+
+
+def save_archive(
+    path: str | Path,
+    sudokus: Iterable[Sudoku | SudokuBoard | str],
+    include_solution: bool = False,
+) -> int:
+    """
+    Write sudoku puzzles to a packed binary archive, using 4 bits per cell.
+
+    Parameters
+    ----------
+    path: str | Path
+        File to write the archive to, will be overwritten if it exists.
+        The file is only replaced once every puzzle has been written.
+    sudokus: Iterable[Sudoku | SudokuBoard | str]
+        Sudoku puzzles in any of the supported formats, the original board is saved.
+    include_solution: bool = False
+        Whether to store each puzzle's solution alongside it.
+
+    Returns
+    -------
+    int
+        The number of puzzles written.
+    """
+    flags = _FLAG_SOLUTION if include_solution else 0
+    count = 0
+
+    # write to a temporary file first, so a failure can't leave a partial archive
+    directory = Path(path).resolve().parent
+    with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as file:
+        try:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, flags, 0))
+
+            for sudoku in sudokus:
+                if not isinstance(sudoku, Sudoku):
+                    sudoku = Sudoku(sudoku)
+
+                file.write(sudoku.to_bytes(include_solution=include_solution))
+                count += 1
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+
+    os.replace(file.name, path)
+    return count
+
+
+class PuzzleArchive:
+    """
+    A read-only view of a packed binary archive of sudoku puzzles. The file is
+    memory-mapped, and records are exposed as memoryview slices without copying.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Parameters
+        ----------
+        path: str | Path
+            Location of an archive written with `save_archive`.
+            The header will be validated once opened.
+        """
+        with open(path, "rb") as file:
+            self._mmap: mmap.mmap | None = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        self._view = memoryview(self._mmap)
+
+        try:
+            self._validate()
+        except ValueError:
+            self.close()
+            raise
+
+    @property
+    def has_solutions(self) -> bool:
+        """Whether each record also contains the puzzle's solution."""
+        return bool(self._flags & _FLAG_SOLUTION)
+
+    @property
+    def record_size(self) -> int:
+        """Number of bytes used by each record in the archive."""
+        return _PACKED_BOARD_SIZE * (2 if self.has_solutions else 1)
+
+    def record(self, index: int) -> memoryview:
+        """
+        Get the raw packed record at the given index, without copying.
+
+        Parameters
+        ----------
+        index: int
+            Position of the record, negative values count from the end.
+
+        Returns
+        -------
+        memoryview
+            The packed record, readable with `Sudoku.from_bytes`.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Archive index out of range (index={index}).")
+
+        start = _HEADER.size + index * self.record_size
+        return self._view[start : start + self.record_size]
+
+    def records(self, start: int = 0, stop: int | None = None) -> memoryview:
+        """
+        Get a contiguous run of packed records, without copying.
+
+        Parameters
+        ----------
+        start: int = 0
+        stop: int | None = None
+            Range of record indices, as with slicing a list.
+
+        Returns
+        -------
+        memoryview
+            The packed records, each `record_size` bytes long.
+        """
+        start, stop, _ = slice(start, stop).indices(self._count)
+        stop = max(start, stop)
+        offset = _HEADER.size
+        return self._view[
+            offset + start * self.record_size : offset + stop * self.record_size
+        ]
+
+    def board(self, index: int) -> SudokuBoard:
+        """Unpack the puzzle board at the given index."""
+        return _unpack_board(self.record(index))
+
+    def solution(self, index: int) -> SudokuBoard | None:
+        """Unpack the stored solution at the given index, or None if not stored."""
+        if not self.has_solutions:
+            return None
+        return _unpack_board(self.record(index)[_PACKED_BOARD_SIZE:])
+
+    def close(self) -> None:
+        """
+        Release the memory-mapped file. Record memoryviews still in use remain
+        readable, and the file is unmapped once the last of them is released.
+        """
+        if self._mmap is None:
+            return
+
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # views are still exported, dropping our reference below lets the
+            # mmap be closed once they have all been released
+            pass
+
+        self._mmap = None
+
+    def __len__(self) -> int:
+        """Number of puzzles in the archive."""
+        return self._count
+
+    def __getitem__(self, index: int) -> Sudoku:
+        """Unpack the puzzle at the given index, with its cached solution if stored."""
+        return Sudoku.from_bytes(self.record(index))
+
+    def __iter__(self) -> Iterator[Sudoku]:
+        """Unpack each puzzle in the archive, in order."""
+        for index in range(self._count):
+            yield self[index]
+
+    def __enter__(self) -> "PuzzleArchive":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _validate(self):
+        """
+        Check the archive header and size, and read the number of records.
+
+        No return, will raise an exception on failed validation.
+        """
+        if len(self._view) < _HEADER.size:
+            raise ValueError("Archive is invalid, file is too small.")
+
+        magic, version, self._flags, _ = _HEADER.unpack_from(self._view)
+        if magic != _MAGIC:
+            raise ValueError("Archive is invalid, unrecognised file format.")
+        if version != _VERSION:
+            raise ValueError(f"Archive is invalid, unsupported version ({version}).")
+        if self._flags & ~_FLAG_SOLUTION:
+            raise ValueError(f"Archive is invalid, unknown flags ({self._flags:#x}).")
+
+        count, remainder = divmod(len(self._view) - _HEADER.size, self.record_size)
+        if remainder != 0:
+            raise ValueError("Archive is invalid, file contains a partial record.")
+
+        self._count = count
@@ -1,10 +1,29 @@
 from itertools import product
-from random import sample
+from random import sample, shuffle
+from time import monotonic
 
 from sudoku_gaming.sudoku import Sudoku, SudokuBoard
+from sudoku_gaming.utils import (
+    _SYMMETRIES,
+    _count_solutions,
+    _shuffle_grid,
+    _symmetry_orbits,
+)
 
 
-def generate(difficulty: int = 5) -> Sudoku:
+# maximum number of values the solver may try when checking a candidate is unique
+_UNIQUE_BUDGET = 5_000
+
+# number of shuffled candidates to try before solving for a fresh grid
+_SHUFFLES_PER_GRID = 500
+
+
+def generate(
+    difficulty: int = 5,
+    pattern: SudokuBoard | str | None = None,
+    symmetry: str | None = None,
+    time_limit: float = 5.0,
+) -> Sudoku:
     """
     Randomly generate a sudoku puzzle of the chosen difficulty rating.
 
@@ -13,26 +32,50 @@ def generate(difficulty: int = 5) -> Sudoku:
     difficulty: int = 5
         Scale of 1 to 9, indicating how much of the board is already filled in.
         Defaults to 5 (medium difficulty).
+    pattern: SudokuBoard | str | None = None
+        A 9x9 clue mask, in either of the formats accepted by `Sudoku`, where
+        non-zero cells are clues. The generated puzzle will have a unique solution
+        with exactly these cells filled in, and `difficulty` is ignored.
+    symmetry: str | None = None
+        One of "rot180", "rot90", "diagonal", "antidiagonal", "horizontal",
+        "vertical" or "none". Clues are removed in symmetric groups, while keeping
+        the solution unique, trying new solved boards until `difficulty` is reached.
+    time_limit: float = 5.0
+        Maximum number of seconds to spend on a `pattern` or `symmetry` puzzle.
+        A `pattern` search raises a TimeoutError when time runs out, whereas a
+        `symmetry` search returns the puzzle with the most blank cells found,
+        which may be easier than `difficulty` (especially for 8 and above).
 
     Returns
     -------
     Sudoku
         A valid, unsolved, Sudoku puzzle.
     """
+    if pattern is not None and symmetry is not None:
+        raise ValueError("Only one of pattern or symmetry can be given.")
+
     # ensure difficulty is between 1 and 9
     if difficulty < 1:
         difficulty = 1
     elif difficulty > 9:
         difficulty = 9
 
+    # use the provided difficulty to calculate how many cells to clear
+    num_to_clear = 72 - int(63 * ((9 - difficulty) / 8))
+
+    if pattern is not None:
+        return _generate_from_pattern(pattern, deadline=monotonic() + time_limit)
+
+    if symmetry is not None:
+        return _generate_symmetric(
+            symmetry, num_to_clear, deadline=monotonic() + time_limit
+        )
+
     # use the solver to generate a valid sudoku
     sudoku = Sudoku()
     assert sudoku.solved is not None
     sudoku._board = sudoku.solved
 
-    # use the provided difficulty to calculate how many cells to clear
-    num_to_clear = 72 - int(63 * ((9 - difficulty) / 8))
-
     # choose them randomly, and set to 0
     all_cells = list(product(range(1, 10), range(1, 10)))
     cells_to_clear = sample(all_cells, num_to_clear)
@@ -44,6 +87,153 @@ def generate(difficulty: int = 5) -> Sudoku:
     return Sudoku(sudoku.board)
 
 
+def _generate_symmetric(symmetry: str, num_to_clear: int, deadline: float) -> Sudoku:
+    """
+    Generate a uniquely solvable sudoku, by clearing symmetric groups of cells
+    from solved boards in a random order, trying new boards until the target
+    number of blank cells is reached.
+
+    Parameters
+    ----------
+    symmetry: str
+        Must be one of the keys of `_SYMMETRIES`.
+    num_to_clear: int
+        Target number of blank cells, rounded down to a number the symmetric
+        groups of cells can add up to.
+    deadline: float
+        Time (as per `time.monotonic`) to stop searching, and return the puzzle
+        with the most blank cells found so far.
+
+    Returns
+    -------
+    Sudoku
+        A valid, unsolved, Sudoku puzzle with a unique solution.
+    """
+    if symmetry not in _SYMMETRIES:
+        raise ValueError(
+            f"Symmetry must be one of {', '.join(_SYMMETRIES)} (symmetry={symmetry})."
+        )
+
+    orbits = _symmetry_orbits(symmetry)
+
+    # find the largest number of blank cells, up to the target, that orbits can make
+    reachable = {0}
+    for orbit in orbits:
+        size = len(orbit)
+        reachable |= {n + size for n in reachable if n + size <= num_to_clear}
+    num_to_clear = max(reachable)
+
+    best_board: SudokuBoard = []
+    best_solved: SudokuBoard = []
+    best_cleared = -1
+    solved: SudokuBoard = []
+    attempt = 0
+    while best_cleared < num_to_clear:
+        if attempt > 0 and monotonic() > deadline:
+            break
+
+        # shuffle the current solved board, getting a fresh one now and then
+        if attempt % _SHUFFLES_PER_GRID == 0:
+            fresh = Sudoku().solved
+            assert fresh is not None
+            solved = fresh
+        attempt += 1
+
+        candidate = _shuffle_grid(solved)
+        board = [list(row) for row in candidate]
+        shuffle(orbits)
+
+        num_cleared = 0
+        for orbit in orbits:
+            if num_cleared + len(orbit) > num_to_clear:
+                continue
+
+            # clear the whole orbit, restoring it if the solution is no longer unique
+            for (x, y) in orbit:
+                board[x][y] = 0
+
+            if _count_solutions(board, limit=2, budget=_UNIQUE_BUDGET) == 1:
+                num_cleared += len(orbit)
+            else:
+                for (x, y) in orbit:
+                    board[x][y] = candidate[x][y]
+
+        if num_cleared > best_cleared:
+            best_board, best_solved, best_cleared = board, candidate, num_cleared
+
+    return _unique_sudoku(best_board, best_solved)
+
+
+def _generate_from_pattern(pattern: SudokuBoard | str, deadline: float) -> Sudoku:
+    """
+    Generate a uniquely solvable sudoku with clues in exactly the given cells,
+    by searching over shuffled solved boards until one is found.
+
+    Parameters
+    ----------
+    pattern: SudokuBoard | str
+        A 9x9 clue mask, where non-zero cells are clues.
+    deadline: float
+        Time (as per `time.monotonic`) to give up searching.
+
+    Returns
+    -------
+    Sudoku
+        A valid, unsolved, Sudoku puzzle with a unique solution.
+    """
+    if isinstance(pattern, str):
+        pattern = [[int(n) for n in row] for row in pattern.split(",")]
+
+    if len(pattern) != 9 or any(len(row) != 9 for row in pattern):
+        raise ValueError("Pattern is invalid, must be a 9x9 clue mask.")
+
+    clues = [(x, y) for x in range(9) for y in range(9) if pattern[x][y]]
+
+    # no sudoku with fewer than 17 clues has a unique solution
+    if len(clues) < 17:
+        raise ValueError(f"Pattern has too few clues to be unique ({len(clues)}).")
+
+    # two empty rows in a band (or columns in a stack) can always be swapped
+    for lines in (pattern, list(zip(*pattern))):
+        for start in [0, 3, 6]:
+            empty = [line for line in lines[start : start + 3] if not any(line)]
+            if len(empty) > 1:
+                raise ValueError("Pattern can never have a unique solution.")
+
+    solved: SudokuBoard = []
+    attempt = 0
+    while monotonic() < deadline:
+        # shuffle the current solved board, getting a fresh one now and then
+        if attempt % _SHUFFLES_PER_GRID == 0:
+            fresh = Sudoku().solved
+            assert fresh is not None
+            solved = fresh
+        attempt += 1
+
+        candidate = _shuffle_grid(solved)
+        board = [[0 for _ in range(9)] for _ in range(9)]
+        for (x, y) in clues:
+            board[x][y] = candidate[x][y]
+
+        # a unique solution needs at least 8 different values in the clues
+        if len({board[x][y] for (x, y) in clues}) < 8:
+            continue
+
+        if _count_solutions(board, limit=2, budget=_UNIQUE_BUDGET) == 1:
+            return _unique_sudoku(board, candidate)
+
+    raise TimeoutError("No uniquely solvable sudoku found matching the pattern.")
+
+
+def _unique_sudoku(board: SudokuBoard, solved: SudokuBoard) -> Sudoku:
+    """Wrap a puzzle known to have a unique solution in the Sudoku class."""
+    sudoku = Sudoku(board)
+    sudoku._solved = solved
+    sudoku._solve_attempted = True
+    sudoku._unique = True
+    return sudoku
+
+
 def solve(sudoku: Sudoku | SudokuBoard | str) -> Sudoku | None:
     """
     Solve the provided Sudoku puzzle.
@@ -4,10 +4,15 @@ from pathlib import Path
 
 from sudoku_gaming.types import SudokuBoard
 from sudoku_gaming.utils import (
+    _PACKED_BOARD_SIZE,
     _board_string,
     _check_for_duplicates,
+    _count_solutions,
     _get_table_fill_color_matrix,
+    _has_valid_cells,
+    _pack_board,
     _recursive_solve,
+    _unpack_board,
 )
 
 
@@ -42,6 +47,8 @@ class Sudoku:
         self._original = deepcopy(self._board)
         self._solved: SudokuBoard | None = None
         self._solve_attempted = False
+        self._unique: bool | None = None
+        self._unique_budget_spent = 0
 
     def get(self, row: int, col: int) -> int | None:
         """
@@ -138,9 +145,100 @@ class Sudoku:
 
     def solve_original(self) -> None:
         """Try to solve the original sudoku puzzle."""
-        self._solved = _recursive_solve(self._original)
+        self._solved = _recursive_solve(deepcopy(self._original))
         self._solve_attempted = True
 
+    def is_on_track(self, budget: int = 10_000) -> bool:
+        """
+        Check whether the current board can still be completed to a solution
+        of the original puzzle.
+
+        The player's entries are compared against the cached solution first, only
+        solving the current board when the original puzzle has multiple solutions.
+
+        Parameters
+        ----------
+        budget: int = 10_000
+            Maximum number of values the solver may try when a fallback solve is needed.
+            If the budget runs out the board is assumed to be on track.
+
+        Returns
+        -------
+        bool
+            True if the current board can still be solved, False otherwise.
+        """
+        if self.solved is None:
+            return False
+
+        if not self._differs_from_solution(self._board):
+            return True
+
+        if self._is_unique(budget=budget):
+            return False
+
+        if self._overwrites_clue(self._board):
+            return False
+
+        return self._is_solvable(self._with_clues(self._board), budget=budget)
+
+    def first_mistake(self, budget: int = 10_000) -> tuple[int, int] | None:
+        """
+        Find the first cell (in reading order) where the player's entries mean
+        the board can no longer be solved.
+
+        Parameters
+        ----------
+        budget: int = 10_000
+            Maximum number of values the solver may try for each fallback solve.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The (row, col) of the first mistake, using the same coordinates as `get`
+            and `set`, or None if no mistake was found.
+        """
+        solved = self.solved
+        if solved is None:
+            return None
+
+        # with a unique solution, any entry that differs from it is a mistake
+        if self._is_unique(budget=budget):
+            for x in range(9):
+                for y in range(9):
+                    if self._board[x][y] not in (0, solved[x][y]):
+                        return 9 - x, y + 1
+            return None
+
+        if not self._differs_from_solution(self._board):
+            return None
+
+        if not self._overwrites_clue(self._board) and self._is_solvable(
+            self._with_clues(self._board), budget=budget
+        ):
+            return None
+
+        # add the player's entries to the original one at a time, only solving
+        # when an entry strays from the cached solution
+        partial = deepcopy(self._original)
+        for x in range(9):
+            for y in range(9):
+                value = self._board[x][y]
+                if value == 0 or value == self._original[x][y]:
+                    continue
+
+                # changing one of the original clues is always a mistake
+                if self._original[x][y] != 0:
+                    return 9 - x, y + 1
+
+                partial[x][y] = value
+                if not self._differs_from_solution(partial):
+                    continue
+
+                if not self._is_solvable(partial, budget=budget):
+                    return 9 - x, y + 1
+
+        return None
+
     def reset_board(self) -> None:
         """Reset the sudoku to its original state."""
         self._board = deepcopy(self._original)
@@ -155,10 +253,130 @@ class Sudoku:
             print("Error: Current board is not valid.")
             return False
 
+    def to_bytes(self, include_solution: bool = False) -> bytes:
+        """
+        Pack the original board into bytes, using 4 bits per cell (41 bytes).
+        The player's moves on the current board are not included.
+
+        Parameters
+        ----------
+        include_solution: bool = False
+            Whether to append the packed solution, making an 82 byte record.
+
+        Returns
+        -------
+        bytes
+            The packed record, readable with `Sudoku.from_bytes`.
+        """
+        data = _pack_board(self._original)
+
+        if include_solution:
+            if self.solved is None:
+                raise ValueError("Sudoku has no solution to include.")
+            data += _pack_board(self.solved)
+
+        return data
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "Sudoku":
+        """
+        Create a Sudoku from a record packed with `Sudoku.to_bytes`.
+
+        Parameters
+        ----------
+        data: bytes | memoryview
+            A 41 byte puzzle record, or an 82 byte puzzle and solution record.
+            When a solution is included, it is checked and then cached.
+
+        Returns
+        -------
+        Sudoku
+        """
+        if len(data) not in (_PACKED_BOARD_SIZE, 2 * _PACKED_BOARD_SIZE):
+            raise ValueError(f"Packed sudoku has an invalid length ({len(data)}).")
+
+        board = _unpack_board(data)
+        if not _has_valid_cells(board):
+            raise ValueError("Packed sudoku has invalid cell values.")
+
+        try:
+            sudoku = cls(board)
+        except TypeError as error:
+            raise ValueError("Packed sudoku has duplicate values.") from error
+
+        if len(data) == 2 * _PACKED_BOARD_SIZE:
+            solved = _unpack_board(data[_PACKED_BOARD_SIZE:])
+
+            # the solution must be complete, and agree with the puzzle's clues
+            if (
+                not _has_valid_cells(solved)
+                or any(0 in row for row in solved)
+                or _check_for_duplicates(solved)
+                or sudoku._overwrites_clue(solved)
+            ):
+                raise ValueError("Packed sudoku has an invalid solution.")
+
+            sudoku._solved = solved
+            sudoku._solve_attempted = True
+
+        return sudoku
+
     def __repr__(self) -> str:
         """Default representation is the current state of the game board."""
         return _board_string(self._board)
 
+    def _is_unique(self, budget: int) -> bool:
+        """Check if the original puzzle has exactly one solution, caching the result."""
+        if self._unique is None:
+            # skip the search if a budget at least this large has already run out
+            if budget <= self._unique_budget_spent:
+                return False
+
+            count = _count_solutions(self._original, limit=2, budget=budget)
+            if count is None:
+                self._unique_budget_spent = budget
+                return False
+            self._unique = count == 1
+
+        return self._unique
+
+    def _overwrites_clue(self, board: SudokuBoard) -> bool:
+        """Check if any of the original clues has been changed on the given board."""
+        for x in range(9):
+            for y in range(9):
+                clue = self._original[x][y]
+                if clue != 0 and board[x][y] not in (0, clue):
+                    return True
+
+        return False
+
+    def _differs_from_solution(self, board: SudokuBoard) -> bool:
+        """Check if any filled cell of the given board differs from the cached solution."""
+        solved = self.solved
+        assert solved is not None
+
+        for x in range(9):
+            for y in range(9):
+                if board[x][y] not in (0, solved[x][y]):
+                    return True
+
+        return False
+
+    def _with_clues(self, board: SudokuBoard) -> SudokuBoard:
+        """Copy the given board, putting back any original clues that were cleared."""
+        return [
+            [clue or value for clue, value in zip(clue_row, row)]
+            for clue_row, row in zip(self._original, board)
+        ]
+
+    @staticmethod
+    def _is_solvable(board: SudokuBoard, budget: int) -> bool:
+        """Check if the given board can be solved, assuming it can if the budget runs out."""
+        if _check_for_duplicates(board):
+            return False
+
+        return _count_solutions(board, limit=1, budget=budget) != 0
+
     def _validate(self):
         """
         Check that the current board is a valid Sudoku puzzle.
@@ -1,4 +1,4 @@
-from random import shuffle
+from random import random, sample, shuffle
 
 from sudoku_gaming.types import SudokuBoard
 
@@ -154,6 +154,253 @@ def _recursive_solve(sudoku: SudokuBoard) -> SudokuBoard | None:
     return sudoku
 
 
+# bitmask with a bit set for each of the values 1 to 9
+_ALL_VALUES = 0b1111111110
+
+
+def _count_solutions(
+    sudoku: SudokuBoard, limit: int = 2, budget: int | None = None
+) -> int | None:
+    """
+    Count the solutions of a Sudoku puzzle, using the same depth-first backtracking
+    approach as the solver, stopping once `limit` solutions have been found.
+    Used values are tracked as bitmasks for speed. The given board is left unchanged.
+
+    Parameters
+    ----------
+    sudoku: SudokuBoard
+    limit: int = 2
+        Stop searching once this many solutions have been found.
+    budget: int | None = None
+        Maximum number of values to try before giving up, or None for no limit.
+
+    Returns
+    -------
+    int | None
+        The number of solutions found (at most `limit`), or None if the budget ran out.
+    """
+    # bitmasks of the values used in each row, column and 3x3 grid
+    rows = [0] * 9
+    cols = [0] * 9
+    grids = [0] * 9
+    blanks = []
+    for x in range(9):
+        for y in range(9):
+            if sudoku[x][y] == 0:
+                blanks.append((x, y, (x // 3) * 3 + y // 3))
+            else:
+                bit = 1 << sudoku[x][y]
+                rows[x] |= bit
+                cols[y] |= bit
+                grids[(x // 3) * 3 + y // 3] |= bit
+
+    found = 0
+    tries = 0
+
+    def _search() -> bool:
+        """Fill the most constrained blank cell, return True when the search should stop."""
+        nonlocal found, tries
+
+        # if no blank cell is left, the board is a solution
+        if not blanks:
+            found += 1
+            return found >= limit
+
+        # find the blank cell with the least possible values
+        best_index, best_free, best_count = 0, 0, 10
+        for index, (x, y, g) in enumerate(blanks):
+            free = ~(rows[x] | cols[y] | grids[g]) & _ALL_VALUES
+            count = free.bit_count()
+            if count < best_count:
+                best_index, best_free, best_count = index, free, count
+                if count <= 1:
+                    break
+
+        x, y, g = blanks[best_index]
+        blanks[best_index] = blanks[-1]
+        blanks.pop()
+
+        stop = False
+        while best_free and not stop:
+            tries += 1
+            if budget is not None and tries > budget:
+                stop = True
+                break
+
+            bit = best_free & -best_free
+            best_free ^= bit
+            rows[x] |= bit
+            cols[y] |= bit
+            grids[g] |= bit
+            stop = _search()
+            rows[x] ^= bit
+            cols[y] ^= bit
+            grids[g] ^= bit
+
+        # put the cell back, so the caller's view of the blanks is unchanged
+        blanks.append((x, y, g))
+        blanks[best_index], blanks[-1] = blanks[-1], blanks[best_index]
+        return stop
+
+    _search()
+
+    if budget is not None and tries > budget:
+        return None
+
+    return found
+
+
+# cell mappings for each supported symmetry, applied repeatedly to find orbits
+_SYMMETRIES = {
+    "none": lambda x, y: (x, y),
+    "rot180": lambda x, y: (8 - x, 8 - y),
+    "rot90": lambda x, y: (y, 8 - x),
+    "diagonal": lambda x, y: (y, x),
+    "antidiagonal": lambda x, y: (8 - y, 8 - x),
+    "horizontal": lambda x, y: (8 - x, y),
+    "vertical": lambda x, y: (x, 8 - y),
+}
+
+
+def _symmetry_orbits(symmetry: str) -> list[list[tuple[int, int]]]:
+    """
+    Group the cells of a sudoku board into orbits, the sets of cells that are
+    mapped onto each other by the given symmetry.
+
+    Parameters
+    ----------
+    symmetry: str
+        Must be one of the keys of `_SYMMETRIES`.
+
+    Returns
+    -------
+    list[list[tuple[int, int]]]
+        Every cell of the board, grouped into orbits.
+    """
+    mapping = _SYMMETRIES[symmetry]
+    seen = set()
+    orbits = []
+
+    for x in range(9):
+        for y in range(9):
+            if (x, y) in seen:
+                continue
+
+            # keep applying the mapping until we get back to the first cell
+            orbit = [(x, y)]
+            cell = mapping(x, y)
+            while cell != (x, y):
+                orbit.append(cell)
+                cell = mapping(*cell)
+
+            seen.update(orbit)
+            orbits.append(orbit)
+
+    return orbits
+
+
+def _shuffle_grid(board: SudokuBoard) -> SudokuBoard:
+    """
+    Create a new, equally valid, sudoku board by randomly shuffling the rows within
+    each band, the columns within each stack, the bands and stacks themselves,
+    and optionally transposing.
+
+    Parameters
+    ----------
+    board: SudokuBoard
+
+    Returns
+    -------
+    SudokuBoard
+        The shuffled board, the given board is left unchanged.
+    """
+
+    def _order() -> list[int]:
+        """Random line order, keeping lines within the same band together."""
+        return [
+            band * 3 + line
+            for band in sample(range(3), 3)
+            for line in sample(range(3), 3)
+        ]
+
+    row_order = _order()
+    col_order = _order()
+    shuffled = [[board[x][y] for y in col_order] for x in row_order]
+
+    if random() < 0.5:
+        shuffled = [list(col) for col in zip(*shuffled)]
+
+    return shuffled
+
+
+# number of bytes used to store a board, at 4 bits per cell
+_PACKED_BOARD_SIZE = 41
+
+# lookup tables for splitting a byte into its two cells
+_HIGH_NIBBLE = [byte >> 4 for byte in range(256)]
+_LOW_NIBBLE = [byte & 0x0F for byte in range(256)]
+
+
+def _has_valid_cells(board: SudokuBoard) -> bool:
+    """
+    Check that a SudokuBoard is a 9x9 array of integers between 0 and 9 inclusive.
+
+    Parameters
+    ----------
+    board: SudokuBoard
+
+    Returns
+    -------
+    bool
+        True if the structure and values are valid, False otherwise.
+    """
+    return (
+        isinstance(board, list)
+        and len(board) == 9
+        and all(isinstance(row, list) and len(row) == 9 for row in board)
+        and all(isinstance(n, int) and 0 <= n <= 9 for row in board for n in row)
+    )
+
+
+def _pack_board(board: SudokuBoard) -> bytes:
+    """
+    Pack a SudokuBoard into bytes, storing each cell in 4 bits, in reading order.
+    The first cell of each pair is stored in the high nibble.
+
+    Parameters
+    ----------
+    board: SudokuBoard
+
+    Returns
+    -------
+    bytes
+        The packed board, of length `_PACKED_BOARD_SIZE`.
+    """
+    cells = [n for row in board for n in row] + [0]
+    return bytes((cells[i] << 4) | cells[i + 1] for i in range(0, 82, 2))
+
+
+def _unpack_board(data: bytes | memoryview) -> SudokuBoard:
+    """
+    Unpack a SudokuBoard from bytes created with `_pack_board`.
+
+    Parameters
+    ----------
+    data: bytes | memoryview
+        Must contain at least `_PACKED_BOARD_SIZE` bytes, any extra bytes are ignored.
+
+    Returns
+    -------
+    SudokuBoard
+    """
+    cells = []
+    for byte in data[:_PACKED_BOARD_SIZE]:
+        cells.append(_HIGH_NIBBLE[byte])
+        cells.append(_LOW_NIBBLE[byte])
+
+    return [cells[i : i + 9] for i in range(0, 81, 9)]
+
+
 def _get_table_fill_color_matrix(color_1: str = "#CBE9FF", color_2: str = "#FDF2FF"):
     """
     Get the color fill matrix for when saving a sudoku as an image.
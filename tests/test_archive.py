@@ -0,0 +1,162 @@
+"""Tests for the packed binary format and `PuzzleArchive`."""
+
+import pytest
+
+from sudoku_gaming import (
+    PuzzleArchive,
+    Sudoku,
+    generate,
+    pack_board,
+    save_archive,
+    unpack_board,
+)
+from tests.utils import assert_complete_sudoku
+
+
+SUDOKU_STRING = (
+    "310069024,000700503,500043008,"
+    "000007100,090054300,004001980,"
+    "080005031,035800060,472316859"
+)
+
+
+def test_sudoku_bytes():
+    sudoku = Sudoku(SUDOKU_STRING)
+
+    # puzzle only record
+    data = sudoku.to_bytes()
+    assert len(data) == 41
+    assert Sudoku.from_bytes(data).board == sudoku.board
+
+    # puzzle and solution record
+    data = sudoku.to_bytes(include_solution=True)
+    assert len(data) == 82
+    unpacked = Sudoku.from_bytes(data)
+    assert unpacked.board == sudoku.board
+    assert unpacked.solved == sudoku.solved
+
+    with pytest.raises(ValueError):
+        Sudoku.from_bytes(data[:40])
+
+    # the original board is packed, not the player's moves
+    sudoku.set(9, 3, 7)
+    assert Sudoku.from_bytes(sudoku.to_bytes()).board == sudoku.original
+    unpacked = Sudoku.from_bytes(sudoku.to_bytes(include_solution=True))
+    assert unpacked.board == sudoku.original
+    assert unpacked.is_on_track() is True
+
+    # corrupt cell values are rejected
+    with pytest.raises(ValueError):
+        Sudoku.from_bytes(b"\xff" + data[1:41])
+
+    # solutions that disagree with the puzzle are rejected
+    wrong = Sudoku(sudoku.board).to_bytes() + data[41:]
+    with pytest.raises(ValueError):
+        Sudoku.from_bytes(wrong)
+
+    incomplete = data[:41] + data[:41]
+    with pytest.raises(ValueError):
+        Sudoku.from_bytes(incomplete)
+
+
+def test_pack_board():
+    board = Sudoku(SUDOKU_STRING).board
+
+    data = pack_board(board)
+    assert len(data) == 41
+    assert unpack_board(data) == board
+
+    with pytest.raises(ValueError):
+        pack_board([[10] * 9] * 9)
+    with pytest.raises(ValueError):
+        unpack_board(data[:40])
+    with pytest.raises(ValueError):
+        unpack_board(b"\xff" * 41)
+
+
+@pytest.mark.parametrize("include_solution", [False, True])
+def test_puzzle_archive(tmp_path, include_solution):
+    sudokus = [generate() for _ in range(5)]
+    path = tmp_path / "puzzles.sdku"
+
+    assert save_archive(path, sudokus, include_solution=include_solution) == 5
+    assert path.stat().st_size == 8 + 5 * (82 if include_solution else 41)
+
+    with PuzzleArchive(path) as archive:
+        assert len(archive) == 5
+        assert archive.has_solutions is include_solution
+
+        # random access
+        assert archive.board(3) == sudokus[3].board
+        assert archive[-1].board == sudokus[-1].board
+        with pytest.raises(IndexError):
+            archive.record(5)
+
+        # records are zero-copy views of the file
+        record = archive.record(0)
+        assert isinstance(record, memoryview)
+        assert bytes(record) == sudokus[0].to_bytes(include_solution)
+        record.release()
+
+        chunk = archive.records(1, 3)
+        assert len(chunk) == 2 * archive.record_size
+        chunk.release()
+
+        # sequential iteration
+        assert [s.board for s in archive] == [s.board for s in sudokus]
+
+        if include_solution:
+            assert_complete_sudoku(board=archive.solution(2))
+        else:
+            assert archive.solution(2) is None
+
+
+def test_puzzle_archive_invalid(tmp_path):
+    path = tmp_path / "invalid.sdku"
+    path.write_bytes(b"not a sudoku archive")
+
+    with pytest.raises(ValueError):
+        PuzzleArchive(path)
+
+    # unknown header flags are rejected
+    save_archive(path, [SUDOKU_STRING])
+    data = bytearray(path.read_bytes())
+    data[5] |= 0x80
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        PuzzleArchive(path)
+
+
+def test_save_archive_failure(tmp_path):
+    path = tmp_path / "puzzles.sdku"
+    save_archive(path, [SUDOKU_STRING])
+    unsolvable = "123456780,000000009" + ",000000000" * 7
+
+    # a failure part way through leaves the existing archive untouched
+    with pytest.raises(ValueError):
+        save_archive(path, [SUDOKU_STRING, unsolvable], include_solution=True)
+
+    with PuzzleArchive(path) as archive:
+        assert len(archive) == 1
+        assert archive.has_solutions is False
+
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_puzzle_archive_close_with_views(tmp_path):
+    sudokus = [generate() for _ in range(3)]
+    path = tmp_path / "puzzles.sdku"
+    save_archive(path, sudokus)
+
+    # views can outlive the archive, and closing twice is fine
+    with PuzzleArchive(path) as archive:
+        chunk = archive.records(0, 2)
+        record = archive.record(2)
+
+    archive.close()
+    assert bytes(chunk) == sudokus[0].to_bytes() + sudokus[1].to_bytes()
+    assert bytes(record) == sudokus[2].to_bytes()
+
+    chunk.release()
+    record.release()
@@ -3,9 +3,17 @@
 import pytest
 
 from sudoku_gaming import generate, solve
+from sudoku_gaming.utils import _SYMMETRIES, _count_solutions
 from tests.utils import assert_complete_sudoku, count_blanks
 
 
+PATTERN = (
+    "110011011,000100101,100011001,"
+    "000001100,010011100,001001110,"
+    "010001011,011100010,111111111"
+)
+
+
 @pytest.mark.parametrize(
     "difficulty, expected_blanks",
     [
@@ -47,3 +55,56 @@ def test_gaming_solve_from_string():
 
     # check correctly solved
     assert_complete_sudoku(board=sudoku.solved)
+
+
+@pytest.mark.parametrize("symmetry", list(_SYMMETRIES))
+def test_gaming_generate_symmetry(symmetry):
+    sudoku = generate(difficulty=6, symmetry=symmetry)
+
+    # check puzzle is unique, and matches the requested difficulty
+    assert count_blanks(board=sudoku.board) == 49
+    assert _count_solutions(sudoku.board) == 1
+    assert_complete_sudoku(board=sudoku.solved)
+
+    # check blank cells are mapped onto blank cells
+    mapping = _SYMMETRIES[symmetry]
+    for x in range(9):
+        for y in range(9):
+            mx, my = mapping(x, y)
+            assert (sudoku.board[x][y] == 0) == (sudoku.board[mx][my] == 0)
+
+
+def test_gaming_generate_pattern():
+    sudoku = generate(pattern=PATTERN)
+
+    # check clues are exactly where the pattern puts them
+    for row, mask in zip(sudoku.board, PATTERN.split(",")):
+        assert [int(n != 0) for n in row] == [int(m) for m in mask]
+
+    assert _count_solutions(sudoku.board) == 1
+    assert_complete_sudoku(board=sudoku.solved)
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"pattern": PATTERN, "symmetry": "rot180"}, ValueError),
+        ({"symmetry": "spiral"}, ValueError),
+        ({"pattern": [[1] * 9] * 8}, ValueError),
+        ({"pattern": [[1] * 9] + [[0] * 9] * 8}, ValueError),
+        ({"pattern": [[1] * 9] * 7 + [[0] * 9] * 2}, ValueError),
+        ({"pattern": PATTERN, "time_limit": 0}, TimeoutError),
+    ],
+)
+def test_gaming_generate_impossible(kwargs, error):
+    with pytest.raises(error):
+        generate(**kwargs)
+
+
+def test_gaming_generate_symmetry_time_limit():
+    # the best puzzle found is returned when time runs out
+    sudoku = generate(difficulty=9, symmetry="rot180", time_limit=0)
+
+    assert 0 < count_blanks(board=sudoku.board) < 72
+    assert _count_solutions(sudoku.board) == 1
+    assert_complete_sudoku(board=sudoku.solved)
@@ -98,3 +98,79 @@ def test_sudoku_class(input):
 
     # check correctly solved
     assert_complete_sudoku(board=sudoku.solved)
+
+
+def test_sudoku_on_track_unique():
+    sudoku = Sudoku(
+        "310069024,000700503,500043008,"
+        + "000007100,090054300,004001980,"
+        + "080005031,035800060,472316859"
+    )
+
+    # untouched board is on track
+    assert sudoku.is_on_track() is True
+    assert sudoku.first_mistake() is None
+
+    # correct entry keeps the board on track
+    sudoku.set(9, 3, 8)
+    assert sudoku.is_on_track() is True
+    assert sudoku.first_mistake() is None
+
+    # entry without duplicates, but not part of the solution
+    sudoku.set(9, 3, 7)
+    assert sudoku.is_on_track() is False
+    assert sudoku.first_mistake() == (9, 3)
+
+
+def test_sudoku_on_track_multiple_solutions():
+    # solved board, with a swappable rectangle of 5s and 7s cleared
+    sudoku = Sudoku(
+        "318069024,946028013,527143698,"
+        + "263987145,891654372,754231986,"
+        + "689475231,135892467,072316859"
+    )
+
+    # either value in the rectangle can still be solved
+    sudoku.set(9, 4, 5)
+    assert sudoku.is_on_track() is True
+    assert sudoku.first_mistake() is None
+
+    sudoku.set(9, 4, 7)
+    assert sudoku.is_on_track() is True
+    assert sudoku.first_mistake() is None
+
+    # a clashing entry is a mistake
+    sudoku.set(1, 1, 9)
+    assert sudoku.is_on_track() is False
+    assert sudoku.first_mistake() == (1, 1)
+
+
+def test_sudoku_on_track_overwritten_clue():
+    # a single clue has many solutions
+    sudoku = Sudoku("500000000" + ",000000000" * 8)
+
+    # a valid move that differs from the cached solution is still on track,
+    # including when the solver runs out of budget
+    sudoku.set(9, 2, 1 if sudoku.solved[0][1] != 1 else 2)
+    assert sudoku.is_on_track(budget=1) is True
+    assert sudoku.is_on_track() is True
+    assert sudoku.first_mistake() is None
+
+    # overwriting the clue is a mistake, even though the board can be solved
+    sudoku.set(9, 1, 6)
+    assert sudoku.is_on_track() is False
+    assert sudoku.first_mistake() == (9, 1)
+
+
+def test_sudoku_on_track_cleared_clue():
+    sudoku = Sudoku("500000000" + ",000000000" * 8)
+
+    # clearing a clue is not a mistake in itself
+    sudoku.set(9, 1, 0)
+    assert sudoku.is_on_track() is True
+    assert sudoku.first_mistake() is None
+
+    # but the cleared clue still counts when checking the player's entries
+    sudoku.set(9, 2, 5)
+    assert sudoku.is_on_track() is False
+    assert sudoku.first_mistake() == (9, 2)